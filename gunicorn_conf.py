@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for production deployments.
+
+Run from the repository root with:
+
+    gunicorn -c gunicorn_conf.py src.app:app
+
+Note: the app keeps users, capabilities, and audit logs in process-local
+memory, so each worker has its own copy of mutable state. Run with a
+single worker (WEB_CONCURRENCY=1) until state is moved to a shared store.
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Default to a single worker: app state is per-process (see module docstring),
+# so more workers would silently stop sharing registrations and audit logs.
+# Once state lives in a shared store, size with the standard 2*cores+1 for
+# IO-bound ASGI apps, e.g. WEB_CONCURRENCY=$((2 * $(nproc) + 1)).
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+
+# Recycle workers periodically to bound any slow leaks.
+max_requests = 10_000
+max_requests_jitter = 1_000
+
+accesslog = "-"
+errorlog = "-"
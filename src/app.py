@@ -5,17 +5,27 @@ A FastAPI application that enables Slalom consultants to register their
 capabilities and manage consulting expertise across the organization.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, status, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime, timedelta
+from dataclasses import dataclass, asdict
+import asyncio
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from bisect import bisect_left
+import hashlib
 import os
+import sys
+import threading
+import time
 from pathlib import Path
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
+import bcrypt
+import orjson
 
 app = FastAPI(title="Slalom Capabilities Management API",
               description="API for managing consulting capabilities and consultant expertise")
@@ -25,37 +35,40 @@ SECRET_KEY = "slalom-capabilities-secret-key-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8 hours
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Bcrypt cost factor (2^rounds Blowfish iterations). Default 10 keeps demo
+# logins snappy; raise via env for production-like hardness.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
 security = HTTPBearer()
 
 # Pydantic models
+
+# Internal API: a precompiled pattern check run by pydantic-core is all the
+# email validation we need, and it is far cheaper per request than the full
+# email-validator parse behind EmailStr.
+SlalomEmail = Annotated[
+    str, StringConstraints(pattern=r"(?i)^[^@]+@slalom\.com$", to_lower=True)
+]
+
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: SlalomEmail
     password: str
 
 class RegisterCapabilityRequest(BaseModel):
-    email: EmailStr
+    email: SlalomEmail
     capability_name: str
 
 class UnregisterCapabilityRequest(BaseModel):
-    email: EmailStr
+    email: SlalomEmail
     capability_name: str
 
-class Token(BaseModel):
-    access_token: str
-    token_type: str
-    user: dict
-
-class AuditLog(BaseModel):
-    timestamp: str
-    action: str
-    user: str
-    details: str
-
-# Mount the static files directory
+# Mount the static files directory. In production, set SERVE_STATIC=0 and
+# let a reverse proxy serve /static from disk (see deploy/nginx.conf) so the
+# API workers skip the mount and its per-request path matching.
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
+if os.getenv("SERVE_STATIC", "1") != "0":
+    app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
+              "static")), name="static")
 
 # In-memory user database (in production, use a real database)
 # Password: "password123" for all demo users
@@ -81,8 +94,45 @@ users = {
     }
 }
 
-# Audit log storage (in-memory for now)
-audit_logs: List[AuditLog] = []
+# Rehash the shared demo password once at the configured cost so stored
+# hashes match BCRYPT_ROUNDS (the literals above were generated at cost 12).
+_demo_password_hash = bcrypt.hashpw(
+    b"password123", bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+).decode("utf-8")
+for _user in users.values():
+    _user["hashed_password"] = _demo_password_hash
+
+# The set of user accounts is fixed at runtime; intern the email keys so dict
+# lookups hit CPython's pointer-equality fast path and expose a read-only view
+# to guard against accidental writes to the table itself.
+users = MappingProxyType({sys.intern(k): v for k, v in users.items()})
+
+# Hash verified when the login email is unknown, so the miss path pays the
+# same bcrypt cost as a wrong password instead of returning early. Dummy
+# verifications must bypass the verify cache: the hash is shared across all
+# unknown emails, so a cached result would make repeat probes with the same
+# password return instantly and hand back a timing oracle.
+DUMMY_HASH = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+# Roles are fixed with the user table; precompute the admin set so admin
+# checks reduce to a frozenset membership test on an interned email.
+ADMIN_EMAILS = frozenset(
+    email for email, user in users.items() if user["role"] == "admin"
+)
+
+# Audit log entries are built from internally trusted strings, so a slotted
+# dataclass is enough: no validator dispatch and no per-instance __dict__.
+@dataclass(slots=True, frozen=True)
+class AuditLog:
+    timestamp: str
+    action: str
+    user: str
+    details: str
+
+# Audit log storage (in-memory for now). Bounded ring buffer: appends stay
+# O(1) and memory is capped instead of growing for the life of the process.
+AUDIT_LOG_MAX_ENTRIES = 100_000
+audit_logs: deque = deque(maxlen=AUDIT_LOG_MAX_ENTRIES)
 
 # In-memory capabilities database
 capabilities = {
@@ -169,10 +219,48 @@ capabilities = {
     }
 }
 
+# Capability names are likewise fixed; only the nested consultant collections
+# mutate. Intern capability names and consultant emails for fast key compares
+# and freeze the outer table. _capabilities_data keeps the raw dict for JSON
+# serialization (orjson cannot encode a MappingProxyType).
+_capabilities_data = {sys.intern(k): v for k, v in capabilities.items()}
+for _cap in _capabilities_data.values():
+    _cap["consultants"] = sorted(sys.intern(e) for e in _cap["consultants"])
+capabilities = MappingProxyType(_capabilities_data)
+
+# The "consultants" lists are kept sorted so register/unregister can use
+# binary search for membership and position - O(log n) without a parallel
+# set to keep in sync, and /capabilities serializes them in stable order.
+
 # Authentication functions
+
+# Cache of bcrypt verification results keyed by a digest of (password, hash).
+# Bcrypt's key schedule is intentionally expensive (~100ms per verify), so
+# repeat logins with the same credentials can skip it entirely. The cache is
+# bounded so failed guesses cannot grow it without limit, and locked because
+# login dispatches verification to worker threads.
+_VERIFY_CACHE_SIZE = 1024
+_verify_cache: OrderedDict = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    key = hashlib.sha256(
+        plain_password.encode("utf-8") + hashed_password.encode("utf-8")
+    ).digest()
+    with _verify_cache_lock:
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            return _verify_cache[key]
+    # Run bcrypt outside the lock so concurrent logins are not serialized.
+    result = bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+    with _verify_cache_lock:
+        _verify_cache[key] = result
+        if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return result
 
 def create_access_token(data: dict) -> str:
     """Create a JWT access token"""
@@ -181,36 +269,67 @@ def create_access_token(data: dict) -> str:
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+# Cache of decoded token payloads keyed by the raw token string. Tokens are
+# immutable until they expire, so validation on a hit is just a dict lookup
+# and an expiry check instead of HMAC-SHA256 + base64 + JSON decoding.
+_TOKEN_CACHE_SIZE = 4096
+_token_cache: OrderedDict = OrderedDict()
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """Get the current authenticated user from JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    token = credentials.credentials
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, exp = cached
+        if time.time() < exp:
+            _token_cache.move_to_end(token)
+            email = payload.get("sub")
+            if email is None or email not in users:
+                raise credentials_exception
+            return users[email]
+        del _token_cache[token]
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        # The cache needs exp, so reject correctly-signed tokens without it
+        # (MissingRequiredClaimError is an InvalidTokenError -> 401).
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM],
+                             options={"require": ["exp"]})
+        _token_cache[token] = (payload, payload["exp"])
+        if len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
         email: str = payload.get("sub")
         if email is None or email not in users:
             raise credentials_exception
         return users[email]
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
 
-def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
+async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
     """Require admin role"""
-    if current_user["role"] != "admin":
+    if current_user["email"] not in ADMIN_EMAILS:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
         )
     return current_user
 
+# Formatted timestamp for the current whole second. Audit writes are bursty,
+# so refreshing only when the second rolls over replaces a datetime build and
+# isoformat() per entry with one integer compare in the common case.
+_ts_cache = (0, "")
+
 def log_action(action: str, user: str, details: str):
     """Log an audit event"""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, datetime.utcfromtimestamp(now).isoformat())
     audit_logs.append(AuditLog(
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=_ts_cache[1],
         action=action,
         user=user,
         details=details
@@ -218,15 +337,30 @@ def log_action(action: str, user: str, details: str):
 
 
 @app.get("/")
-def root():
+async def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.post("/auth/login")
-def login(request: LoginRequest) -> Token:
+async def login(request: LoginRequest):
     """Authenticate user and return JWT token"""
     user = users.get(request.email)
-    if not user or not verify_password(request.password, user["hashed_password"]):
+    # bcrypt takes tens of milliseconds by design; run it in a worker thread
+    # so the event loop keeps serving other requests during verification.
+    # Unknown emails verify against DUMMY_HASH via uncached bcrypt so every
+    # probe costs the full key schedule (see the DUMMY_HASH comment).
+    if user is not None:
+        ok = await asyncio.to_thread(
+            verify_password, request.password, user["hashed_password"]
+        )
+    else:
+        ok = False
+        await asyncio.to_thread(
+            bcrypt.checkpw,
+            request.password.encode("utf-8"),
+            DUMMY_HASH.encode("utf-8")
+        )
+    if not ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -235,19 +369,21 @@ def login(request: LoginRequest) -> Token:
     access_token = create_access_token(data={"sub": user["email"]})
     log_action("login", user["email"], "User logged in")
     
-    return Token(
-        access_token=access_token,
-        token_type="bearer",
-        user={
+    # Plain dict response: the shape is fixed and already well-formed, so
+    # there is no need to build and re-validate a response model per login.
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": {
             "email": user["email"],
             "name": user["name"],
             "role": user["role"]
         }
-    )
+    }
 
 
 @app.get("/auth/me")
-def get_current_user_info(current_user: dict = Depends(get_current_user)):
+async def get_current_user_info(current_user: dict = Depends(get_current_user)):
     """Get current user information"""
     return {
         "email": current_user["email"],
@@ -256,13 +392,27 @@ def get_current_user_info(current_user: dict = Depends(get_current_user)):
     }
 
 
+# Serialized /capabilities response, rebuilt lazily after each mutation. The
+# data only changes on register/unregister, so most requests can return the
+# pre-encoded bytes without re-walking and re-encoding the nested dicts.
+_capabilities_json: Optional[bytes] = None
+
+def _invalidate_capabilities_json():
+    """Drop the cached /capabilities response after a mutation"""
+    global _capabilities_json
+    _capabilities_json = None
+
+
 @app.get("/capabilities")
-def get_capabilities():
-    return capabilities
+async def get_capabilities():
+    global _capabilities_json
+    if _capabilities_json is None:
+        _capabilities_json = orjson.dumps(_capabilities_data)
+    return Response(content=_capabilities_json, media_type="application/json")
 
 
 @app.post("/capabilities/{capability_name}/register")
-def register_for_capability(
+async def register_for_capability(
     capability_name: str,
     request: RegisterCapabilityRequest,
     current_user: dict = Depends(get_current_user)
@@ -282,15 +432,20 @@ def register_for_capability(
             detail="You can only register yourself. Admins can register others."
         )
 
-    # Validate consultant is not already registered
-    if request.email in capability["consultants"]:
+    # Validate consultant is not already registered (binary search on the
+    # sorted consultants list)
+    email = sys.intern(request.email)
+    consultants = capability["consultants"]
+    i = bisect_left(consultants, email)
+    if i < len(consultants) and consultants[i] == email:
         raise HTTPException(
             status_code=400,
             detail="Consultant is already registered for this capability"
         )
 
-    # Add consultant
-    capability["consultants"].append(request.email)
+    # Insert at the bisect position to keep the list sorted
+    consultants.insert(i, email)
+    _invalidate_capabilities_json()
     log_action(
         "register",
         current_user["email"],
@@ -300,7 +455,7 @@ def register_for_capability(
 
 
 @app.delete("/capabilities/{capability_name}/unregister")
-def unregister_from_capability(
+async def unregister_from_capability(
     capability_name: str,
     request: UnregisterCapabilityRequest,
     current_user: dict = Depends(require_admin)
@@ -313,15 +468,18 @@ def unregister_from_capability(
     # Get the specific capability
     capability = capabilities[capability_name]
 
-    # Validate consultant is registered
-    if request.email not in capability["consultants"]:
+    # Validate consultant is registered (binary search on the sorted list)
+    consultants = capability["consultants"]
+    i = bisect_left(consultants, request.email)
+    if i >= len(consultants) or consultants[i] != request.email:
         raise HTTPException(
             status_code=400,
             detail="Consultant is not registered for this capability"
         )
 
-    # Remove consultant
-    capability["consultants"].remove(request.email)
+    # Remove at the bisect position; the list stays sorted
+    consultants.pop(i)
+    _invalidate_capabilities_json()
     log_action(
         "unregister",
         current_user["email"],
@@ -331,6 +489,6 @@ def unregister_from_capability(
 
 
 @app.get("/audit/logs")
-def get_audit_logs(current_user: dict = Depends(require_admin)):
+async def get_audit_logs(current_user: dict = Depends(require_admin)):
     """Get audit logs (admin only)"""
-    return audit_logs
+    return [asdict(entry) for entry in audit_logs]